@@ -0,0 +1,83 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+
+class LRUCache(OrderedDict):
+    """
+    A dictionary holding at most `maxsize` items, evicting the least recently used first.
+    Both reads and writes mark an item as recently used, so iteration order always runs
+    from least to most recently used. This lets the cache round-trip through a JSON file
+    without storing any extra timestamps.
+    Reads reorder the dictionary, so every access takes a lock to stay safe across threads.
+    """
+    def __init__(self, maxsize=DEFAULT_CACHE_MAX_ENTRIES, *args, **kwargs):
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self[key] if key in self else default
+
+# How long a cached Comic Vine response stays fresh, in seconds. Searches and issue lists
+# use the default so new issues show up; details of a published issue rarely change.
+DEFAULT_RESPONSE_CACHE_TTL = 24 * 60 * 60
+ISSUE_DETAILS_TTL = 30 * 24 * 60 * 60
+
+class ResponseCache:
+    """
+    Stores Comic Vine response bodies in a SQLite file, keyed by URL and query parameters,
+    so repeated runs over the same series don't spend API calls on data already fetched.
+    Entries older than `ttl` seconds are treated as missing. Entries older than `max_ttl`,
+    the longest lifetime any lookup asks for, can never be used again and are deleted
+    when the cache is opened, so the file doesn't keep growing.
+    """
+    def __init__(self, path, ttl=DEFAULT_RESPONSE_CACHE_TTL, max_ttl=ISSUE_DETAILS_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, body BLOB NOT NULL)')
+        self._conn.execute('DELETE FROM responses WHERE fetched_at < ?', (time.time() - max(ttl, max_ttl),))
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url, params):
+        """Builds the cache key. The API key is left out, so changing it keeps the cache valid."""
+        return f"{url}?{urlencode(sorted((k, v) for k, v in params.items() if k != 'api_key'))}"
+
+    def get(self, url, params, ttl=None):
+        """
+        Returns the cached body for a request, or None if it's missing or expired.
+        `ttl` overrides the cache's default lifetime for this lookup.
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT fetched_at, body FROM responses WHERE key = ?', (self.make_key(url, params),)).fetchone()
+        if row and time.time() - row[0] < (self.ttl if ttl is None else ttl):
+            return row[1]
+        return None
+
+    def set(self, url, params, body):
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO responses (key, fetched_at, body) VALUES (?, ?, ?)', (self.make_key(url, params), time.time(), body))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
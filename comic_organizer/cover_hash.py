@@ -0,0 +1,96 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from imagehash import ImageHash
+from PIL import Image
+
+# Same parameters as imagehash.phash, so the hashes are interchangeable
+HASH_SIZE = 8
+HIGHFREQ_FACTOR = 4
+IMG_SIZE = HASH_SIZE * HIGHFREQ_FACTOR
+
+# Below this many covers per process, starting a process pool costs more than it saves
+MIN_COVERS_PER_PROCESS = 8
+
+def _thumbnail(image):
+    """Reduces an image to the 32x32 luma thumbnail that pHash works on."""
+    return np.asarray(image.convert('L').resize((IMG_SIZE, IMG_SIZE), Image.LANCZOS), dtype=np.float32)
+
+def _dct_matrix():
+    """
+    The first HASH_SIZE rows of the unnormalized type-II DCT matrix for IMG_SIZE samples,
+    matching scipy.fft.dct, which imagehash uses.
+    """
+    k = np.arange(HASH_SIZE)[:, np.newaxis]
+    n = np.arange(IMG_SIZE)[np.newaxis, :]
+    return 2 * np.cos(np.pi * k * (2 * n + 1) / (2 * IMG_SIZE))
+
+# Only the lowest 8x8 frequencies are kept, so rather than running a full 32x32 DCT,
+# compute just those as D @ X @ D.T: two small matrix products over the whole batch
+DCT_MATRIX = _dct_matrix()
+
+def _hash_pixels(pixels):
+    """Runs the DCT and median threshold over an (N, 32, 32) float32 stack of thumbnails."""
+    # Pixels are whole numbers, so rounding only removes floating point noise. Without it,
+    # coefficients that are exactly zero in a real DCT (e.g. on flat images) can land either
+    # side of the median.
+    lowfreq = np.round(DCT_MATRIX @ pixels @ DCT_MATRIX.T, 6)
+    medians = np.median(lowfreq, axis=(1, 2), keepdims=True)
+    return [ImageHash(bits) for bits in lowfreq > medians]
+
+def batch_phash(images):
+    """
+    Computes the perceptual hash of many images at once.
+    Gives the same result as calling imagehash.phash on each image, but the DCT and
+    median thresholding run as single NumPy calls over an (N, 32, 32) stack,
+    instead of once per image.
+    Returns a list of ImageHash objects in the same order as `images`.
+    """
+    if not images:
+        return []
+
+    return _hash_pixels(np.stack([_thumbnail(image) for image in images]))
+
+def open_thumbnail_source(cover):
+    """
+    Opens encoded cover bytes for hashing. For JPEGs, draft() lets libjpeg decode straight
+    to grayscale at up to 1/8 scale, skipping most of the full-size decode. The hash can then
+    differ from imagehash.phash on the full image by a bit or two, which is fine for matching.
+    """
+    image = Image.open(io.BytesIO(cover))
+    image.draft('L', (IMG_SIZE, IMG_SIZE))
+    return image
+
+def phash_bytes(covers):
+    """
+    Decodes a list of encoded cover images and hashes them as one batch.
+    A cover that can't be decoded gets None instead of a hash, so one bad archive
+    doesn't stop the rest from being hashed.
+    """
+    thumbnails = []
+    for cover in covers:
+        try:
+            thumbnails.append(_thumbnail(open_thumbnail_source(cover)))
+        except Exception:  # Pillow raises a range of errors on corrupt or unsupported data
+            thumbnails.append(None)
+
+    decoded = [thumbnail for thumbnail in thumbnails if thumbnail is not None]
+    hashes = iter(_hash_pixels(np.stack(decoded)) if decoded else [])
+    return [None if thumbnail is None else next(hashes) for thumbnail in thumbnails]
+
+def parallel_phash(covers, max_workers=None):
+    """
+    Hashes a list of encoded cover images, splitting the decoding, resizing and DCT
+    across processes so they aren't serialized by the GIL.
+    Returns a list of ImageHash objects (None for covers that can't be decoded) in the
+    same order as `covers`.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(covers) // MIN_COVERS_PER_PROCESS)
+    if workers <= 1:
+        return phash_bytes(covers)
+
+    chunk_size = -(-len(covers) // workers)
+    chunks = [covers[i:i + chunk_size] for i in range(0, len(covers), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [cover_hash for chunk_hashes in executor.map(phash_bytes, chunks) for cover_hash in chunk_hashes]
@@ -0,0 +1,87 @@
+import logging
+import multiprocessing
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from colorama import Fore, Style
+
+# Between INFO and WARNING, used for the green "✔" confirmations
+SUCCESS = 25
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+LEVEL_COLORS = {
+    logging.DEBUG: Style.DIM,
+    logging.INFO: Fore.CYAN,
+    SUCCESS: Fore.GREEN,
+    logging.WARNING: Fore.YELLOW,
+    logging.ERROR: Fore.RED,
+}
+
+class RunarrLogger(logging.Logger):
+    def success(self, msg, *args, **kwargs):
+        if self.isEnabledFor(SUCCESS):
+            self._log(SUCCESS, msg, args, **kwargs)
+
+class ColorFormatter(logging.Formatter):
+    """Colors each record by its level and resets the style afterwards."""
+    def format(self, record):
+        return f"{LEVEL_COLORS.get(record.levelno, '')}{super().format(record)}{Style.RESET_ALL}"
+
+class ConsoleHandler(logging.Handler):
+    """
+    Writes records with print() so they go to whatever sys.stdout is at emit time.
+    This keeps log output working with colorama's wrapper and rich's progress bars,
+    which both swap sys.stdout after the handler is created.
+    """
+    def emit(self, record):
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+_default_logger_class = logging.getLoggerClass()
+logging.setLoggerClass(RunarrLogger)
+log = logging.getLogger('runarr')
+logging.setLoggerClass(_default_logger_class)
+
+def setup_logging(verbose=False, quiet=False):
+    """
+    Configures the runarr logger. Quiet shows only warnings and errors,
+    verbose adds debug output such as rate limit sleeps.
+    """
+    if quiet:
+        level = logging.WARNING
+    elif verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+
+    handler = ConsoleHandler()
+    handler.setFormatter(ColorFormatter('%(message)s'))
+    log.handlers[:] = [handler]
+    log.setLevel(level)
+    log.propagate = False
+
+def forward_logging(queue, level):
+    """
+    Sends the runarr logger's records to `queue` instead of the console.
+    Runs as the initializer of worker processes, see worker_logging.
+    """
+    log.handlers[:] = [QueueHandler(queue)]
+    log.setLevel(level)
+    log.propagate = False
+
+@contextmanager
+def worker_logging():
+    """
+    Lets worker processes log through this process. Yields the (initializer, initargs)
+    to pass to a ProcessPoolExecutor; a listener thread prints the workers' records with
+    the console handler, one whole line at a time. Without it, workers started with spawn
+    (the default on macOS and Windows) have no handler and their output is lost.
+    """
+    queue = multiprocessing.Queue()
+    listener = QueueListener(queue, *log.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        yield forward_logging, (queue, log.level)
+    finally:
+        listener.stop()
@@ -2,72 +2,124 @@ import argparse
 from colorama import Fore, Style, init
 import os
 from dotenv import load_dotenv
-import guessit
-import imagehash
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
-from rarfile import RarFile, is_rarfile
-from PIL import Image
 from datetime import datetime
 import xml.etree.ElementTree as ET
 import tempfile
 import shutil
+import errno
 import json
+import orjson
+import sqlite3
 import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
 from pathlib import Path
-from functools import wraps
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 import select
+import threading
 import sys
 from rich.progress import Progress
 from comic_organizer.comic_info import generate_comic_info_xml
 from comic_organizer.series_info import generate_series_data, write_series_json
+from comic_organizer.cache import LRUCache, ResponseCache, DEFAULT_CACHE_MAX_ENTRIES, ISSUE_DETAILS_TTL
+from comic_organizer.log import log, setup_logging, worker_logging
+from comic_organizer.cover_hash import parallel_phash, phash_bytes
 
 # Rate limiting for Comic Vine API
 COMICVINE_API_KEY = ""
-LAST_API_CALL_TIME = 0
-API_CALL_TIMESTAMPS = []
+LAST_API_CALL_TIME = float('-inf')
+# Comic Vine counts the hourly limit separately for each resource (search, volume, issue...),
+# so each one keeps its own window of call times, oldest first. Times come from time.monotonic.
+API_CALL_TIMESTAMPS = defaultdict(deque)
 HOURLY_LIMIT = 199  # Leave a small buffer
 MIN_SECONDS_BETWEEN_CALLS = 4.0
 
-def rate_limited():
+# Comic Vine calls from worker threads share the limiter state above, so they take turns.
+# Re-entrant because make_api_request holds it around each comicvine_get call.
+RATE_LIMIT_LOCK = threading.RLock()
+
+# Number of comics in a folder identified and organized concurrently
+COMIC_WORKERS = 8
+
+GUESSIT_LOCK = threading.Lock()
+
+# Serializes reads from RAR archives, see extract_cover_bytes
+RAR_LOCK = threading.Lock()
+
+def load_rarfile():
+    """Imports rarfile on first use, so libraries without any CBR files never load it."""
+    import rarfile
+    return rarfile
+
+# Comic Vine search results by series title, kept for the whole run
+SEARCH_RESULTS_CACHE = {}
+
+# One shared session so Comic Vine calls reuse keep-alive connections instead of paying a
+# new TCP + TLS handshake each time. Transient server errors are retried with backoff;
+# Comic Vine's own 420 rate limit response is handled by make_api_request.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "ComicOrganizer/1.0"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], respect_retry_after_header=True)))
+
+# Comic Vine responses persisted between runs, opened in main()
+RESPONSE_CACHE = None
+# Set by --force-refresh: ignore cached responses and issue details, but still store the fresh ones
+FORCE_REFRESH = False
+
+# Buffer size for streaming archive entries; large pages copy in a handful of reads/writes
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+def api_resource(url):
+    """Returns the Comic Vine resource a request counts against, e.g. 'volume' for .../api/volume/4050-1/."""
+    parts = urlsplit(url).path.strip('/').split('/')
+    return parts[1] if len(parts) > 1 else parts[0]
+
+def comicvine_get(url, params):
     """
-    Decorator to ensure API calls respect both a minimum delay and an hourly limit.
+    Sends a GET request through the shared session, first waiting as needed to respect both
+    a minimum delay between calls and the hourly limit of the resource being requested.
+    Every Comic Vine request, including retries after a 420, goes through here so that all
+    of them are counted.
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            global LAST_API_CALL_TIME, API_CALL_TIMESTAMPS
-
-            # 1. Enforce minimum time between calls
-            current_time = time.time()
-            time_since_last_call = current_time - LAST_API_CALL_TIME
-            if time_since_last_call < MIN_SECONDS_BETWEEN_CALLS:
-                sleep_time = MIN_SECONDS_BETWEEN_CALLS - time_since_last_call
-                print(f"{Style.DIM} Rate limit: sleeping for {sleep_time:.2f}s to maintain call frequency.{Style.RESET_ALL}")
-                time.sleep(sleep_time)
-
-            # 2. Enforce hourly limit
-            one_hour_ago = time.time() - 3600
-            # Remove timestamps older than an hour
-            API_CALL_TIMESTAMPS[:] = [t for t in API_CALL_TIMESTAMPS if t > one_hour_ago]
-
-            if len(API_CALL_TIMESTAMPS) >= HOURLY_LIMIT:
-                oldest_call = API_CALL_TIMESTAMPS[0]
-                wait_time = (oldest_call + 3600) - time.time()
-                if wait_time > 0:
-                    print(f"{Fore.YELLOW} ⚠️ Rate limit: hourly limit reached. Waiting for {wait_time:.2f}s.{Style.RESET_ALL}")
-                    time.sleep(wait_time)
-
-            # Make the API call
-            result = func(*args, **kwargs)
-
-            # Record the call
-            LAST_API_CALL_TIME = time.time()
-            API_CALL_TIMESTAMPS.append(LAST_API_CALL_TIME)
-
-            return result
-        return wrapper
-    return decorator
+    global LAST_API_CALL_TIME
+
+    with RATE_LIMIT_LOCK:
+        # 1. Enforce minimum time between calls
+        current_time = time.monotonic()
+        time_since_last_call = current_time - LAST_API_CALL_TIME
+        if time_since_last_call < MIN_SECONDS_BETWEEN_CALLS:
+            sleep_time = MIN_SECONDS_BETWEEN_CALLS - time_since_last_call
+            log.debug(" Rate limit: sleeping for %.2fs to maintain call frequency.", sleep_time)
+            time.sleep(sleep_time)
+
+        # 2. Enforce this resource's hourly limit
+        resource = api_resource(url)
+        timestamps = API_CALL_TIMESTAMPS[resource]
+        one_hour_ago = time.monotonic() - 3600
+        # Drop timestamps older than an hour; they are in order, so only the front needs checking
+        while timestamps and timestamps[0] <= one_hour_ago:
+            timestamps.popleft()
+
+        if len(timestamps) >= HOURLY_LIMIT:
+            wait_time = (timestamps[0] + 3600) - time.monotonic()
+            if wait_time > 0:
+                log.warning(" ⚠️ Rate limit: hourly limit for %s reached. Waiting for %.2fs.", resource, wait_time)
+                time.sleep(wait_time)
+            timestamps.popleft()
+
+        try:
+            return SESSION.get(url, params=params)
+        finally:
+            # Record the call, even if it failed
+            LAST_API_CALL_TIME = time.monotonic()
+            timestamps.append(LAST_API_CALL_TIME)
+
 
 def interruptible_wait(duration):
     """
@@ -116,91 +168,248 @@ def interruptible_wait(duration):
     sys.stdout.flush()
     return False, duration
 
+def retry_after_seconds(response, default):
+    """
+    Returns how long the server asked us to wait via a Retry-After header (in seconds),
+    or `default` if it didn't say. Lets a 420 wait end as soon as Comic Vine allows.
+    """
+    try:
+        return max(1, int(response.headers.get('Retry-After')))
+    except (TypeError, ValueError):
+        return default
 
-
-
-def make_api_request(url, params, headers):
+def make_api_request(url, params):
     """
     Makes an API request with retry logic for 420 errors, including an interruptible wait.
     Returns the response object on success, None on failure.
     """
-    try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response
-    except requests.exceptions.RequestException as e:
-        if hasattr(e, 'response') and e.response is not None and e.response.status_code == 420:
-            wait_duration = 3600
-            while wait_duration > 0:
-                print(f"{Fore.YELLOW} ⚠️ API rate limit (420) hit. Waiting...{Style.RESET_ALL}")
+    # Hold the limiter for the whole request, so a 420 wait pauses every worker thread
+    # instead of each of them hitting the limit and starting its own countdown.
+    with RATE_LIMIT_LOCK:
+        try:
+            response = comicvine_get(url, params)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            if hasattr(e, 'response') and e.response is not None and e.response.status_code == 420:
+                wait_duration = retry_after_seconds(e.response, default=3600)
+                while wait_duration > 0:
+                    log.warning(" ⚠️ API rate limit (420) hit. Waiting...")
                 
-                retry_now, time_waited = interruptible_wait(wait_duration)
-                wait_duration -= time_waited
-
-                if retry_now or wait_duration <= 0:
-                    print(f"\n{Fore.CYAN} 🏃‍➡️ Retrying request to {url}...{Style.RESET_ALL}")
-                    try:
-                        response = requests.get(url, params=params, headers=headers)
-                        response.raise_for_status()
-                        return response  # Success!
-                    except requests.exceptions.RequestException as retry_e:
-                        if hasattr(retry_e, 'response') and retry_e.response is not None and retry_e.response.status_code == 420:
-                            print(f"{Fore.RED} ✗ Retry failed. Resuming wait.{Style.RESET_ALL}")
-                            continue  # Continue the while loop to wait more
-                        else:
-                            print(f"{Fore.RED} ✗ Error on retry: {retry_e}{Style.RESET_ALL}")
-                            return None # Different error, give up
+                    retry_now, time_waited = interruptible_wait(wait_duration)
+                    wait_duration -= time_waited
+
+                    if retry_now or wait_duration <= 0:
+                        log.info("\n 🏃‍➡️ Retrying request to %s...", url)
+                        try:
+                            response = comicvine_get(url, params)
+                            response.raise_for_status()
+                            return response  # Success!
+                        except requests.exceptions.RequestException as retry_e:
+                            if hasattr(retry_e, 'response') and retry_e.response is not None and retry_e.response.status_code == 420:
+                                log.error(" ✗ Retry failed. Resuming wait.")
+                                continue  # Continue the while loop to wait more
+                            else:
+                                log.error(" ✗ Error on retry: %s", retry_e)
+                                return None # Different error, give up
             
-            print(f"{Fore.RED} ✗ Could not complete request after waiting and retrying.{Style.RESET_ALL}")
-            return None
-        else:
-            print(f"{Fore.RED} ✗ API Request Error: {e}{Style.RESET_ALL}")
-            return None
+                log.error(" ✗ Could not complete request after waiting and retrying.")
+                return None
+            else:
+                log.error(" ✗ API Request Error: %s", e)
+                return None
+
+def parse_response(response):
+    """Decodes a Comic Vine JSON response with orjson, which is much faster than response.json() on large payloads."""
+    return orjson.loads(response.content)
+
+def get_api_json(url, params, ttl=None):
+    """
+    Returns the decoded JSON for a Comic Vine request, or None on failure.
+    Served from the on-disk response cache when possible, which costs no API call
+    and skips the rate limiter. Successful responses are added to the cache.
+    `ttl` sets how old (in seconds) a cached response may be; defaults to the cache's own.
+    """
+    if RESPONSE_CACHE and not FORCE_REFRESH:
+        body = RESPONSE_CACHE.get(url, params, ttl=ttl)
+        if body is not None:
+            log.debug("   Using cached response for %s", url)
+            return orjson.loads(body)
+
+    response = make_api_request(url, params)
+    if not response:
+        return None
+
+    payload = parse_response(response)
+    # Comic Vine reports some errors (e.g. an unknown ID) in the body with a 200 status
+    if RESPONSE_CACHE and payload.get('status_code', 1) == 1:
+        RESPONSE_CACHE.set(url, params, response.content)
+    return payload
+
+COMIC_EXTENSIONS = ('.cbz', '.cbr')
+# Name of the temp file an archive is rebuilt into, see overwrite_comic_info_in_archive
+TEMP_ARCHIVE_PREFIX = '.runarr-'
+TEMP_ARCHIVE_SUFFIX = '.tmp'
+
+def scan_folder(folder):
+    """
+    Lists a folder in one os.scandir pass.
+    Returns a tuple: (comic paths, other files as (path, name) tuples, subdirectory paths).
+    """
+    comics = []
+    other_files = []
+    subdirs = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk, don't descend into symlinked directories
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.name.lower().endswith(COMIC_EXTENSIONS):
+                comics.append(entry.path)
+            elif entry.name.startswith(TEMP_ARCHIVE_PREFIX) and entry.name.endswith(TEMP_ARCHIVE_SUFFIX):
+                continue  # Left behind by an interrupted run, so not an extra to move
+            elif entry.is_file():
+                other_files.append((entry.path, entry.name))
+    return comics, other_files, subdirs
 
 def scan_comic_files(input_dir):
-    comic_files = []
-    for root, _, files in os.walk(input_dir):
-        for file in files:
-            if file.lower().endswith(('.cbz', '.cbr')):
-                comic_files.append(os.path.join(root, file))
-    return comic_files
+    """
+    Finds every CBZ/CBR file under input_dir, grouped by the folder that contains it.
+    Returns a dict of folder -> (comic paths, other files as (path, name) tuples), with
+    folders in the same order as os.walk. Keeping the other files means each folder is
+    listed only once, even though its extras are moved later. Unreadable directories are skipped.
+    """
+    comics_by_folder = {}
+    # Normalized, so folder keys never end in a separator and match their saved selections
+    pending = [os.path.normpath(input_dir)]
+    while pending:
+        folder = pending.pop()
+        try:
+            comics, other_files, subdirs = scan_folder(folder)
+        except OSError:
+            continue
+        if comics:
+            comics_by_folder[folder] = (comics, other_files)
+        # Reversed so the first subdirectory is popped (and walked) first
+        pending.extend(reversed(subdirs))
+    return comics_by_folder
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Page formats that are already compressed, so deflating them again costs CPU for next to no space
+PRECOMPRESSED_EXTENSIONS = IMAGE_EXTENSIONS + ('.gif', '.webp')
+
+def find_cover_name(names):
+    """
+    Returns the first image name in sorted order (the cover), or None if there are no images.
+    A single min() pass, rather than sorting every page name just to take the first one.
+    """
+    return min((name for name in names if name.lower().endswith(IMAGE_EXTENSIONS)), default=None)
 
-import io
+def has_image_name(names):
+    """Returns whether any of the names is an image. Stops at the first one found, unlike find_cover_name."""
+    return any(name.lower().endswith(IMAGE_EXTENSIONS) for name in names)
 
-def extract_cover_image(comic_file_path):
+def cover_hash_key(comic_file_path):
+    """
+    Key for remembering an archive's cover hash. Changes whenever the archive is replaced or edited.
+    Returns None if the archive can't be read, e.g. because it was moved away mid-run.
+    """
+    try:
+        stat = os.stat(comic_file_path)
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{comic_file_path}"
+
+def open_cbz(comic_file_path, zf=None):
+    """
+    Opens a .cbz for reading. If the caller already has it open as `zf`, that is used
+    instead and left open, so one comic's central directory is only parsed once.
+    """
+    return nullcontext(zf) if zf is not None else zipfile.ZipFile(comic_file_path, 'r')
+
+def extract_cover_bytes(comic_file_path, zf=None):
+    """
+    Returns the encoded bytes of an archive's cover image, or None if there isn't one.
+    The bytes are only decoded when needed, e.g. in the hashing worker processes.
+    """
     try:
         image_data = None
         if comic_file_path.lower().endswith('.cbz'):
-            with zipfile.ZipFile(comic_file_path, 'r') as archive:
-                image_files = sorted([f for f in archive.namelist() if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
-                if image_files:
-                    with archive.open(image_files[0]) as image_file:
+            with open_cbz(comic_file_path, zf) as archive:
+                cover_name = find_cover_name(archive.namelist())
+                if cover_name:
+                    with archive.open(cover_name) as image_file:
                         image_data = image_file.read()
         elif comic_file_path.lower().endswith('.cbr'):
-            with RarFile(comic_file_path, 'r') as archive:
-                image_files = sorted([f for f in archive.namelist() if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
-                if image_files:
-                    with archive.open(image_files[0]) as image_file:
+            # CBZ covers are read in parallel, but RAR reads go through the external
+            # unrar/bsdtar tool, which isn't reliably safe to run concurrently
+            with RAR_LOCK, load_rarfile().RarFile(comic_file_path, 'r') as archive:
+                cover_name = find_cover_name(info.filename for info in archive.infoiter())
+                if cover_name:
+                    with archive.open(cover_name) as image_file:
                         image_data = image_file.read()
         
         if image_data:
-            return Image.open(io.BytesIO(image_data))
+            return image_data
 
     except Exception as e:
-        print(f"{Fore.RED} ✗ Error extracting cover from {comic_file_path}: {e}{Style.RESET_ALL}")
+        log.error(" ✗ Error extracting cover from %s: %s", comic_file_path, e)
     return None
 
+def has_cover_image(comic_file_path, zf=None):
+    """
+    Checks that an archive contains a cover image by reading only its file listing,
+    for when the cover's bytes aren't needed (no hashing).
+    """
+    try:
+        if comic_file_path.lower().endswith('.cbz'):
+            with open_cbz(comic_file_path, zf) as archive:
+                return has_image_name(archive.namelist())
+        elif comic_file_path.lower().endswith('.cbr'):
+            with RAR_LOCK, load_rarfile().RarFile(comic_file_path, 'r') as archive:
+                return has_image_name(info.filename for info in archive.infoiter())
+    except Exception as e:
+        log.error(" ✗ Error extracting cover from %s: %s", comic_file_path, e)
+    return False
+
+def prepare_comic(comic_file_path, overwrite=False, read_cover=True):
+    """
+    Does the local, per-file work for a comic ahead of the (sequential) API loop.
+    Reads any embedded ComicInfo.xml and only looks for the cover when there is no
+    usable local metadata, since that is the only case that always needs it.
+    Returns a tuple: (local_details, is_complete, cover_data). cover_data is the encoded
+    cover, or when read_cover is False just whether the archive has one, so covers
+    that will never be hashed aren't decompressed and held in memory.
+    """
+    # Open a .cbz once for both lookups. If it can't be opened, each lookup tries on its
+    # own and reports the error as before.
+    zf = None
+    if comic_file_path.lower().endswith('.cbz'):
+        try:
+            zf = zipfile.ZipFile(comic_file_path, 'r')
+        except (OSError, zipfile.BadZipFile):
+            pass
+
+    with zf if zf is not None else nullcontext():
+        local_details, is_complete = read_comic_info_from_archive(comic_file_path, overwrite=overwrite, zf=zf)
+        cover_data = None
+        if not local_details:
+            cover_data = extract_cover_bytes(comic_file_path, zf) if read_cover else has_cover_image(comic_file_path, zf)
+    return local_details, is_complete, cover_data
+
+
 def load_volume_from_series_json(folder_path, overwrite=False):
     """
     Loads volume information from a series.json file if it exists in the folder.
     """
     if overwrite:
-        print(f"{Fore.YELLOW} ⚠️ Overwrite flag is set. Ignoring existing series.json.{Style.RESET_ALL}")
+        log.warning(" ⚠️ Overwrite flag is set. Ignoring existing series.json.")
         return None
         
     series_json_path = os.path.join(folder_path, 'series.json')
     if os.path.exists(series_json_path):
-        print(f"{Fore.GREEN}✔ Found existing series.json at: {series_json_path}{Style.RESET_ALL}")
+        log.success("✔ Found existing series.json at: %s", series_json_path)
         try:
             with open(series_json_path, 'r', encoding='utf-8') as f:
                 series_data = json.load(f)
@@ -217,107 +426,159 @@ def load_volume_from_series_json(folder_path, overwrite=False):
                 'image': {'original_url': metadata.get('comic_image')}
             }
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"{Fore.RED} ✗ Warning: Could not read existing series.json ({e}). Will fetch from API.{Style.RESET_ALL}")
+            log.error(" ✗ Warning: Could not read existing series.json (%s). Will fetch from API.", e)
     return None
 
+def volume_record(volume):
+    """
+    Trims a volume down to the fields read once it has been selected. The volume is kept for
+    the whole run and copied into every cached issue, so the description and character, team
+    and location lists of the full details would otherwise be stored over and over.
+    """
+    publisher = volume.get('publisher') or {}
+    return {
+        'id': volume.get('id'),
+        'name': volume.get('name'),
+        'start_year': volume.get('start_year'),
+        'publisher': {'name': publisher.get('name')},
+    }
+
 import re
 
-def identify_comic(comic_file_path, cover_image, series_cache, volume_issues_cache, issue_details_cache, output_dir, dry_run, progress, version_str=None, overwrite=False):
+SERIES_FOLDER_RE = re.compile(r'(.*?)\s*\((\d{4})\)')
+# In one pass over a file name: a parenthesized group such as "(2016)" or "(digital)",
+# matched only so it is skipped whole; a '#'-prefixed number; or a standalone number
+# (including decimals)
+ISSUE_TOKEN_RE = re.compile(r'\(.*?\)|#(?P<hash>\d+(?:\.\d+)?)|\b(?P<num>\d+(?:\.\d+)?)\b')
+# A volume marker in a folder name, e.g. "v2" in "X-Men v2 (1991)"
+VERSION_RE = re.compile(r'\b(v\d+)\b', re.IGNORECASE)
+# The volume ID in a Comic Vine URL, e.g. ".../4050-12345/"
+VOLUME_URL_RE = re.compile(r'/4050-(\d+)/')
+
+@lru_cache(maxsize=1024)
+def parse_series_folder(folder_name):
+    """
+    Extracts the series title and year from a folder name like 'Batman (2016)'.
+    Returns a tuple: (series_title, series_year), where the year may be None.
+    Memoized, since every comic in a folder parses the same folder name.
+    """
+    match = SERIES_FOLDER_RE.match(folder_name)
+    if match:
+        return match.group(1).strip(), match.group(2)
+    return folder_name, None
+
+def resolve_volume(folder_path, series_title, series_year, series_cache, volume_issues_cache, output_dir, dry_run, progress, version_str=None, overwrite=False):
+    """
+    Finds the volume for a series folder and its list of issues, prompting the user if needed.
+    The volume is cached per folder and the issue list per volume, including failures,
+    so each is only resolved once.
+    Returns a tuple: (selected_volume, issues_map), or (None, None) on failure.
+    """
+    # Step 1: Get the selected volume (cached per folder)
+    if folder_path not in series_cache:
+        # Try to load from existing series.json first
+        selected_volume = load_volume_from_series_json(folder_path, overwrite=overwrite)
+
+        if not selected_volume:
+            # If not found or failed to load, then go to the API
+            volume_summary = select_series(series_title, series_year, progress)
+            if not volume_summary:
+                series_cache[folder_path] = None  # Cache failure
+                return None, None
+
+            selected_volume = handle_series_selection(volume_summary, output_dir, dry_run, version_str, overwrite=overwrite)
+
+            # Freshly fetched details already list the volume's issues, which saves the
+            # separate issue list request below
+            if selected_volume and 'issues' in selected_volume:
+                volume_issues_cache[selected_volume.get('id')] = index_volume_issues(selected_volume['issues'])
+
+        series_cache[folder_path] = volume_record(selected_volume) if selected_volume else None
+
+    selected_volume = series_cache[folder_path]
+    if not selected_volume:
+        return None, None
+
+    # Step 2: Get the list of all issues for the volume (cached per volume, so folders
+    # holding the same volume share one fetch)
+    volume_id = selected_volume.get('id')
+    issues_map = volume_issues_cache.get(volume_id)
+    if issues_map is None:
+        issues_map = fetch_volume_issues(selected_volume)
+        volume_issues_cache[volume_id] = issues_map
+
+    if not issues_map:
+        return None, None
+    return selected_volume, issues_map
+
+def find_issue_number(file_name, series_year=None):
+    """
+    Picks the issue number out of a file name in a single scan, ignoring anything in
+    parentheses. The first '#'-prefixed number wins; otherwise the last standalone number
+    that isn't a likely year (19xx/20xx or the series year). Returns None if nothing fits.
+    """
+    issue_number = None
+    for match in ISSUE_TOKEN_RE.finditer(file_name):
+        if match['hash']:
+            return match['hash']
+        num = match['num']
+        if num and not ((len(num) == 4 and num[:2] in ('19', '20')) or num == series_year):
+            issue_number = num
+    return issue_number
+
+def normalize_issue_number(issue_number):
+    """Normalizes an issue number for lookups: "001" -> "1", "1.10" -> "1.1". Non-numeric values are returned as is."""
+    try:
+        normalized = str(float(issue_number))
+    except (TypeError, ValueError):
+        return issue_number
+    return normalized[:-2] if normalized.endswith('.0') else normalized
+
+@lru_cache(maxsize=4096)
+def guess_file_name(file_name):
+    """Runs guessit on a file name. Memoized, since guessit is slow and results only depend on the name."""
+    # Imported here, as loading guessit takes longer than the rest of startup and most
+    # file names never need it
+    import guessit
+    with GUESSIT_LOCK:  # guessit configures itself lazily on first use, which is not thread-safe
+        return guessit.guessit(file_name)
+
+def identify_comic(comic_file_path, folder_path, cover_hash, series_cache, volume_issues_cache, issue_details_cache, overwrite=False):
+    """
+    Identifies one comic in a folder whose volume was already resolved by resolve_volume.
+    Runs on worker threads, so it only reads the series and issue caches and never prompts.
+    """
     file_name = os.path.basename(comic_file_path)
-    folder_name = os.path.basename(os.path.dirname(comic_file_path))
-    folder_path = os.path.dirname(comic_file_path)
+    folder_name = os.path.basename(folder_path)
 
     # Extract series title and year from folder name
-    match = re.match(r'(.*?)\s*\((\d{4})\)', folder_name)
-    if match:
-        series_title = match.group(1).strip()
-        series_year = match.group(2)
-    else:
-        series_title = folder_name
-        series_year = None
+    series_title, series_year = parse_series_folder(folder_name)
 
     # --- New Heuristic-Based Issue Number Extraction ---
-    issue_number = None
-    
-    # Pre-process the filename to remove content in parentheses
-    clean_file_name = re.sub(r'\(.*?\)', '', file_name)
+    # 1. Prioritize numbers prefixed with '#', otherwise take the last standalone number
+    # that doesn't look like a year. Content in parentheses is skipped.
+    issue_number = find_issue_number(file_name, series_year)
 
-    # 1. Prioritize numbers prefixed with '#'
-    hash_match = re.search(r'#(\d+(?:\.\d+)?)', clean_file_name)
-    if hash_match:
-        issue_number = hash_match.group(1)
-    else:
-        # 2. Find all standalone numbers (including decimals) in the filename
-        potential_numbers = re.findall(r'\b\d+(?:\.\d+)?\b', clean_file_name)
-        
-        # 3. Filter out likely years
-        non_year_numbers = [
-            num for num in potential_numbers 
-            if not (
-                (len(num) == 4 and (num.startswith('19') or num.startswith('20'))) or
-                (series_year and num == series_year)
-            )
-        ]
-        
-        # 4. Select the last remaining number
-        if non_year_numbers:
-            issue_number = non_year_numbers[-1]
-
-    # 5. Fallback to guessit if the new logic fails
+    # 2. Fallback to guessit if the new logic fails
     if not issue_number:
-        guess = guessit.guessit(file_name)
-        print(f"{Fore.CYAN} 🏃‍➡️ Guessing info from filename: {file_name}{Style.RESET_ALL}")
+        guess = guess_file_name(file_name)
+        log.info(" 🏃‍➡️ Guessing info from filename: %s", file_name)
         issue_number = guess.get('issue') or guess.get('episode')
 
-    if cover_image:
-        cover_hash = imagehash.phash(cover_image)
-        print(f"{Fore.GREEN}✔ Cover hash: {cover_hash}{Style.RESET_ALL}")
-
     if series_title and issue_number:
         issue_number = str(issue_number) # Ensure it's a string
-        print(f"{Fore.CYAN} 🏃‍➡️ Guessed Series: {series_title}, Issue: {issue_number}{Style.RESET_ALL}")
+        log.info(" 🏃‍➡️ Guessed Series: %s, Issue: %s", series_title, issue_number)
         
-        # Step 1: Get the selected volume (cached per folder)
         selected_volume = series_cache.get(folder_path)
-        if selected_volume is None:
-            # Try to load from existing series.json first
-            selected_volume = load_volume_from_series_json(folder_path, overwrite=overwrite)
-            
-            if not selected_volume:
-                # If not found or failed to load, then go to the API
-                volume_summary = select_series(series_title, series_year, progress)
-                if not volume_summary:
-                    series_cache[folder_path] = None  # Cache failure
-                    return None
-                
-                selected_volume = handle_series_selection(volume_summary, output_dir, dry_run, version_str, overwrite=overwrite)
-            
-            series_cache[folder_path] = selected_volume  # Cache the detailed volume
-        
-        if not selected_volume:
-            return None
-
-        # Step 2: Get the list of all issues for the volume (cached per folder)
-        issues_map = volume_issues_cache.get(folder_path)
-        if issues_map is None:
-            issues_map = fetch_volume_issues(selected_volume)
-            volume_issues_cache[folder_path] = issues_map
-        
+        issues_map = volume_issues_cache.get(selected_volume.get('id')) if selected_volume else None
         if not issues_map:
             return None
 
         # Step 3: Find the specific issue in the cached list
-        try:
-            # Normalize issue number: "001" -> "1", "1.10" -> "1.1"
-            normalized_issue_number = str(float(issue_number))
-            if normalized_issue_number.endswith('.0'):
-                normalized_issue_number = normalized_issue_number[:-2]
-        except ValueError:
-            normalized_issue_number = issue_number # Fallback for non-numeric
-
+        normalized_issue_number = normalize_issue_number(issue_number)
         issue_summary = issues_map.get(normalized_issue_number)
         if not issue_summary:
-            print(f"{Fore.YELLOW} ⚠️ Issue #{issue_number} (normalized: {normalized_issue_number}) not found in the fetched issue list.{Style.RESET_ALL}")
+            log.warning(" ⚠️ Issue #%s (normalized: %s) not found in the fetched issue list.", issue_number, normalized_issue_number)
             return None
 
         # Step 4: Check cache or fetch the detailed metadata for the specific issue
@@ -325,21 +586,28 @@ def identify_comic(comic_file_path, cover_image, series_cache, volume_issues_cac
         issue_num_str = issue_summary.get('issue_number')
         cache_key = f"{volume_id}-{issue_num_str}"
 
-        if cache_key in issue_details_cache and not overwrite:
-            print(f"{Fore.GREEN}✔ Found issue #{issue_num_str} in cache. Skipping API call.{Style.RESET_ALL}")
-            return issue_details_cache[cache_key]
+        # --force-refresh skips this cache too, or a refresh would never reach issue details
+        cached_details = None if overwrite or FORCE_REFRESH else issue_details_cache.get(cache_key)
+        if cached_details:
+            log.success("✔ Found issue #%s in cache. Skipping API call.", issue_num_str)
+            return cached_details
         else:
             if overwrite and cache_key in issue_details_cache:
-                print(f"{Fore.YELLOW} ⚠️ Overwrite flag is set. Re-fetching details for issue #{issue_num_str} from API.{Style.RESET_ALL}")
+                log.warning(" ⚠️ Overwrite flag is set. Re-fetching details for issue #%s from API.", issue_num_str)
+            elif FORCE_REFRESH and cache_key in issue_details_cache:
+                log.info(" 🏃‍➡️ Force refresh is set. Re-fetching details for issue #%s from API.", issue_num_str)
+
+            if cover_hash:
+                log.success("✔ Cover hash: %s", cover_hash)
             
             issue_details = fetch_issue_details(issue_summary, selected_volume)
             if issue_details:
-                print(f"{Fore.GREEN}✔ Adding issue #{issue_num_str} to cache.{Style.RESET_ALL}")
+                log.success("✔ Adding issue #%s to cache.", issue_num_str)
                 issue_details_cache[cache_key] = issue_details
             return issue_details
 
     else:
-        print(f"{Fore.YELLOW} ⚠️ Could not guess issue number from '{file_name}'. Skipping.{Style.RESET_ALL}")
+        log.warning(" ⚠️ Could not guess issue number from '%s'. Skipping.", file_name)
         return None
 
 def handle_series_selection(volume_summary, output_dir, dry_run, version_str=None, overwrite=False):
@@ -356,10 +624,10 @@ def handle_series_selection(volume_summary, output_dir, dry_run, version_str=Non
     series_json_path = os.path.join(new_series_folder, 'series.json')
 
     if overwrite and os.path.exists(series_json_path):
-        print(f"{Fore.YELLOW} ⚠️ Overwrite flag is set. Ignoring existing series.json in target folder.{Style.RESET_ALL}")
+        log.warning(" ⚠️ Overwrite flag is set. Ignoring existing series.json in target folder.")
 
     if os.path.exists(series_json_path) and not overwrite:
-        print(f"{Fore.GREEN}✔ Found existing series.json at: {series_json_path}{Style.RESET_ALL}")
+        log.success("✔ Found existing series.json at: %s", series_json_path)
         try:
             with open(series_json_path, 'r', encoding='utf-8') as f:
                 series_data = json.load(f)
@@ -375,78 +643,85 @@ def handle_series_selection(volume_summary, output_dir, dry_run, version_str=Non
                 'image': {'original_url': metadata.get('comic_image')}
             }
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"{Fore.RED} ✗ Warning: Could not read existing series.json ({e}). Will fetch from API.{Style.RESET_ALL}")
+            log.error(" ✗ Warning: Could not read existing series.json (%s). Will fetch from API.", e)
 
     # Check if we already have full details (e.g., from a URL paste)
     # 'last_issue' is a field in the full details but not the search summary.
     if 'last_issue' in volume_summary:
-        print(f"{Fore.CYAN}🏃‍➡️ Using pre-fetched series details...{Style.RESET_ALL}")
+        log.info("🏃‍➡️ Using pre-fetched series details...")
         series_details = volume_summary
     else:
-        print(f"{Fore.CYAN}🏃‍➡️ No series.json found. Fetching details from Comic Vine...{Style.RESET_ALL}")
+        log.info("🏃‍➡️ No series.json found. Fetching details from Comic Vine...")
         volume_id = volume_summary.get('id')
         series_details = fetch_series_details(volume_id)
 
     if not series_details:
-        print(f"{Fore.RED} ✗ Failed to fetch series details.{Style.RESET_ALL}")
+        log.error(" ✗ Failed to fetch series details.")
         return None
 
     series_data = generate_series_data(series_details)
     if series_data:
-        write_series_json(series_data, new_series_folder, dry_run)
+        write_series_json(series_data, new_series_folder, dry_run, session=SESSION)
     return series_details
 
 
-@rate_limited()
 def fetch_series_details(volume_id):
     """Fetches comprehensive details for a given volume."""
-    print(f"{Fore.CYAN} 🏃‍➡️ Fetching full details for volume ID: {volume_id}...{Style.RESET_ALL}")
+    log.info(" 🏃‍➡️ Fetching full details for volume ID: %s...", volume_id)
     url = f"https://comicvine.gamespot.com/api/volume/4050-{volume_id}/"
     params = {
         "api_key": COMICVINE_API_KEY,
         "format": "json",
-        "field_list": "id,name,start_year,publisher,description,count_of_issues,image,last_issue,first_issue,characters,teams,locations,concepts"
+        # 'issues' is the same list fetch_volume_issues asks for, so one request covers both
+        "field_list": "id,name,start_year,publisher,description,count_of_issues,image,last_issue,first_issue,characters,teams,locations,concepts,issues"
     }
-    headers = {"User-Agent": "ComicOrganizer/1.0"}
     
-    response = make_api_request(url, params, headers)
-    if response:
-        return response.json().get('results')
+    payload = get_api_json(url, params)
+    if payload:
+        return payload.get('results')
     return None
 
 
 
-@rate_limited()
 def fetch_volume_issues(volume):
     """
-    Fetches all issues for a given volume and returns a map of issue numbers to issue summaries.
+    Fetches all issues for a given volume and returns a map of normalized issue numbers to issue summaries.
     Rate limited to 1 request per X seconds.
     """
     volume_name = volume.get('name')
     volume_id = volume.get('id')
-    print(f"{Fore.CYAN} 🏃‍➡️ Fetching all issues for volume '{volume_name}' (ID: {volume_id})...{Style.RESET_ALL}")
+    log.info(" 🏃‍➡️ Fetching all issues for volume '%s' (ID: %s)...", volume_name, volume_id)
 
     volume_url = f"https://comicvine.gamespot.com/api/volume/4050-{volume_id}/"
     params = { "api_key": COMICVINE_API_KEY, "format": "json", "field_list": "issues" }
-    headers = { "User-Agent": "ComicOrganizer/1.0" }
 
-    response = make_api_request(volume_url, params, headers)
-    if response:
-        issues = response.json().get('results', {}).get('issues', [])
-        issues_map = {issue['issue_number']: issue for issue in issues}
-        print(f"{Fore.GREEN}✔ Found and cached {len(issues_map)} issues for this volume.{Style.RESET_ALL}")
+    payload = get_api_json(volume_url, params)
+    if payload:
+        issues_map = index_volume_issues(payload.get('results', {}).get('issues', []))
+        log.success("✔ Found and cached %s issues for this volume.", len(issues_map))
         return issues_map
     
     return {}
 
-@rate_limited()
+def index_volume_issues(issues):
+    """
+    Maps normalized issue numbers to the issue stubs of a volume.
+    Indexing once makes each lookup a single dict hit that also matches Comic Vine numbers
+    written like "001" or "1.0". Only the ID and number are kept; the rest of each stub
+    (name, URLs) is never read and the map lives for the run.
+    """
+    issues_map = {}
+    for issue in issues:
+        issues_map.setdefault(normalize_issue_number(issue['issue_number']), {'id': issue['id'], 'issue_number': issue['issue_number']})
+    return issues_map
+
 def fetch_issue_details(issue_summary, volume):
     """
     Fetches the full details for a single issue.
     Rate limited to 1 request per X seconds.
     """
     issue_id = issue_summary.get('id')
-    print(f"{Fore.CYAN} 🏃‍➡️ Fetching details for issue ID: {issue_id}...{Style.RESET_ALL}")
+    log.info(" 🏃‍➡️ Fetching details for issue ID: %s...", issue_id)
 
     issue_url = f"https://comicvine.gamespot.com/api/issue/4000-{issue_id}/"
     params = {
@@ -454,20 +729,43 @@ def fetch_issue_details(issue_summary, volume):
         "format": "json",
         "field_list": "name,issue_number,description,cover_date,release_date,volume,person_credits,character_credits,team_credits,location_credits,story_arc_credits,concept_credits,site_detail_url"
     }
-    headers = { "User-Agent": "ComicOrganizer/1.0" }
 
-    response = make_api_request(issue_url, params, headers)
-    if response:
-        issue_details = response.json().get('results')
+    payload = get_api_json(issue_url, params, ttl=ISSUE_DETAILS_TTL)
+    if payload:
+        issue_details = payload.get('results')
         if issue_details:
-            issue_details['volume'] = volume  # Inject the full volume info
-            print(f"{Fore.GREEN}✔ Found issue: {issue_details.get('name') or volume.get('name')} ({issue_details.get('id')}){Style.RESET_ALL}")
+            issue_details['volume'] = volume  # Inject the volume info
+            log.success("✔ Found issue: %s (%s)", issue_details.get('name') or volume.get('name'), issue_details.get('id'))
             return issue_details
     
     return None
 
 
-@rate_limited()
+def search_volumes(series_title):
+    """
+    Searches Comic Vine for volumes (series) matching a title.
+    Successful results are memoized for the rest of the run, so folders sharing a title
+    (e.g. a run split across folders) only search once. Returns None on failure.
+    """
+    if series_title in SEARCH_RESULTS_CACHE:
+        return SEARCH_RESULTS_CACHE[series_title]
+
+    search_url = "https://comicvine.gamespot.com/api/search/"
+    params = {
+        "api_key": COMICVINE_API_KEY,
+        "format": "json",
+        "query": series_title,
+        "resources": "volume",
+    }
+
+    payload = get_api_json(search_url, params)
+    if not payload:
+        return None
+
+    results = payload.get('results', [])
+    SEARCH_RESULTS_CACHE[series_title] = results
+    return results
+
 def select_series(series_title, series_year=None, progress=None):
     """
     Searches for a series and prompts the user to select from the results.
@@ -478,26 +776,14 @@ def select_series(series_title, series_year=None, progress=None):
     
     try:
         if not COMICVINE_API_KEY:
-            print("  Comic Vine API key is not set. Skipping search.")
+            log.warning("  Comic Vine API key is not set. Skipping search.")
             return None
 
-        print(f"{Fore.CYAN} 🏃‍➡️ Searching Comic Vine for series '{series_title}' (Year: {series_year or 'Any'})...{Style.RESET_ALL}")
+        log.info(" 🏃‍➡️ Searching Comic Vine for series '%s' (Year: %s)...", series_title, series_year or 'Any')
 
-        # Search for the volume (series)
-        search_url = "https://comicvine.gamespot.com/api/search/"
-        params = {
-            "api_key": COMICVINE_API_KEY,
-            "format": "json",
-            "query": series_title,
-            "resources": "volume",
-        }
-        headers = { "User-Agent": "ComicOrganizer/1.0" }
-
-        response = make_api_request(search_url, params, headers)
-        if not response:
+        results = search_volumes(series_title)
+        if results is None:
             return None
-
-        results = response.json().get('results', [])
         
         # Always give the user a choice, even if there's only one result
         print(f"{Fore.YELLOW} 👉 Please select the correct series (or provide a URL):{Style.RESET_ALL}")
@@ -516,14 +802,14 @@ def select_series(series_title, series_year=None, progress=None):
             if choice == 'url':
                 url = input(f"{Fore.YELLOW} 👉 Paste the Comic Vine URL: {Style.RESET_ALL}").strip()
                 # Regex to find the volume ID (e.g., 4050-XXXXX)
-                match = re.search(r'/4050-(\d+)/', url)
+                match = VOLUME_URL_RE.search(url)
                 if match:
                     volume_id = match.group(1)
-                    print(f"{Fore.CYAN} 🏃‍➡️ Found Volume ID {volume_id} from URL. Fetching details...{Style.RESET_ALL}")
+                    log.info(" 🏃‍➡️ Found Volume ID %s from URL. Fetching details...", volume_id)
                     # Fetch full details directly, bypassing the normal search flow
                     return fetch_series_details(volume_id)
                 else:
-                    print(f"{Fore.RED} ✗ Invalid Comic Vine URL format. Please try again.{Style.RESET_ALL}")
+                    log.error(" ✗ Invalid Comic Vine URL format. Please try again.")
                     continue
 
             try:
@@ -531,9 +817,9 @@ def select_series(series_title, series_year=None, progress=None):
                 if 1 <= choice_num <= len(results):
                     return results[choice_num - 1]
                 else:
-                    print(f"{Fore.RED} ✗ Invalid number. Please try again.{Style.RESET_ALL}")
+                    log.error(" ✗ Invalid number. Please try again.")
             except ValueError:
-                print(f"{Fore.RED} ✗ Invalid input. Please enter a number, 'S', or 'URL'.{Style.RESET_ALL}")
+                log.error(" ✗ Invalid input. Please enter a number, 'S', or 'URL'.")
     finally:
         if progress:
             progress.start()
@@ -543,7 +829,15 @@ def select_series(series_title, series_year=None, progress=None):
 
 
 
-def read_comic_info_from_archive(comic_file_path, overwrite=False):
+def zip_has_member(zf, name):
+    """Checks for an archive entry with a dict lookup, instead of building the whole namelist()."""
+    try:
+        zf.getinfo(name)
+        return True
+    except KeyError:
+        return False
+
+def read_comic_info_from_archive(comic_file_path, overwrite=False, zf=None):
     """
     Reads ComicInfo.xml from a .cbz archive.
     Returns a tuple: (details, is_complete)
@@ -551,15 +845,15 @@ def read_comic_info_from_archive(comic_file_path, overwrite=False):
     - is_complete: A boolean indicating if the XML has rich metadata.
     """
     if overwrite:
-        print(f"{Fore.YELLOW} ⚠️ Overwrite flag is set. Ignoring existing ComicInfo.xml.{Style.RESET_ALL}")
+        log.warning(" ⚠️ Overwrite flag is set. Ignoring existing ComicInfo.xml.")
         return None, False
 
     if not comic_file_path.lower().endswith('.cbz'):
         return None, False
 
     try:
-        with zipfile.ZipFile(comic_file_path, 'r') as zf:
-            if 'ComicInfo.xml' not in zf.namelist():
+        with open_cbz(comic_file_path, zf) as zf:
+            if not zip_has_member(zf, 'ComicInfo.xml'):
                 return None, False
             
             with zf.open('ComicInfo.xml') as xml_file:
@@ -600,23 +894,27 @@ def read_comic_info_from_archive(comic_file_path, overwrite=False):
                     'cover_date': cover_date,
                 }
                 
-                print(f"{Fore.GREEN} ✔ Found ComicInfo.xml in {os.path.basename(comic_file_path)}. Complete: {is_complete}{Style.RESET_ALL}")
+                log.success(" ✔ Found ComicInfo.xml in %s. Complete: %s", os.path.basename(comic_file_path), is_complete)
                 return details, is_complete
 
     except (zipfile.BadZipFile, ET.ParseError) as e:
-        print(f"{Fore.RED} ✗ Error reading ComicInfo.xml: {e}{Style.RESET_ALL}")
+        log.error(" ✗ Error reading ComicInfo.xml: %s", e)
         return None, False
     except Exception as e:
-        print(f"{Fore.RED} ✗ Unexpected error parsing ComicInfo.xml: {e}{Style.RESET_ALL}")
+        log.error(" ✗ Unexpected error parsing ComicInfo.xml: %s", e)
         return None, False
 
 
 def overwrite_comic_info_in_archive(cbz_path, xml_content):
     """
     Safely overwrites the ComicInfo.xml in a .cbz file.
+    The new archive is built next to the original, so replacing it is a single atomic
+    rename rather than a copy back from the system temp dir, which is often on another drive.
     """
-    temp_dir = tempfile.mkdtemp()
-    temp_zip_path = os.path.join(temp_dir, os.path.basename(cbz_path))
+    # A plain hidden file rather than a temp directory, so one left behind by an interrupted
+    # run is never scanned as a series folder
+    with tempfile.NamedTemporaryFile(prefix=TEMP_ARCHIVE_PREFIX, suffix=TEMP_ARCHIVE_SUFFIX, dir=os.path.dirname(cbz_path) or '.', delete=False) as temp_file:
+        temp_zip_path = temp_file.name
 
     try:
         with zipfile.ZipFile(cbz_path, 'r') as original_zip:
@@ -628,16 +926,47 @@ def overwrite_comic_info_in_archive(cbz_path, xml_content):
                 # Add the new, enriched ComicInfo.xml
                 new_zip.writestr('ComicInfo.xml', xml_content)
         
+        # NamedTemporaryFile creates the file as 0600, so give it the original's permissions
+        # before it takes the original's place
+        shutil.copymode(cbz_path, temp_zip_path)
         # Replace the original file with the new one
-        shutil.move(temp_zip_path, cbz_path)
-        print(f"{Fore.GREEN} ✔ Successfully overwrote ComicInfo.xml in {os.path.basename(cbz_path)}{Style.RESET_ALL}")
+        move_file(temp_zip_path, cbz_path)
+        log.success(" ✔ Successfully overwrote ComicInfo.xml in %s", os.path.basename(cbz_path))
         return True
     except Exception as e:
-        print(f"{Fore.RED} ✗ Failed to overwrite ComicInfo.xml: {e}{Style.RESET_ALL}")
+        log.error(" ✗ Failed to overwrite ComicInfo.xml: %s", e)
         return False
     finally:
-        rmtree_with_retry(temp_dir)
+        try:
+            os.remove(temp_zip_path)
+        except FileNotFoundError:
+            pass  # Already moved into place
+        except OSError as e:
+            log.warning(" ⚠️ Could not remove temporary file %s: %s", temp_zip_path, e)
+
 
+def move_file(src, dst):
+    """
+    Moves a file, replacing dst if it exists. Within one filesystem this is a single atomic
+    os.replace; across filesystems it falls back to shutil.move, which copies (using the
+    kernel's fast copy where available) and then deletes the original.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+# Output folders already created this run, so organizing many issues into the same
+# series folder doesn't repeat the makedirs call for each one
+ENSURED_DIRS = set()
+
+def ensure_dir(path):
+    """Creates a directory (and parents) once per run."""
+    if path not in ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        ENSURED_DIRS.add(path)
 
 def organize_file(original_path, issue_details, output_dir, dry_run=False, version_str=None, skip_xml_write=False):
     if not issue_details:
@@ -653,7 +982,7 @@ def organize_file(original_path, issue_details, output_dir, dry_run=False, versi
     issue_number_str = issue_details.get('issue_number')
     
     if not all([series_name, volume_year, issue_number_str]):
-        print(f"{Fore.RED} ✗ Could not determine new file name. Missing required details.{Style.RESET_ALL}")
+        log.error(" ✗ Could not determine new file name. Missing required details.")
         return None
 
     # Format the issue number with padding for the integer part
@@ -676,10 +1005,11 @@ def organize_file(original_path, issue_details, output_dir, dry_run=False, versi
         date_formatted = "Unknown Date"
 
     # Check for "Annual" in the original filename
-    annual_str = " Annual" if "annual" in os.path.basename(original_path).lower() else ""
+    original_name = os.path.basename(original_path)
+    annual_str = " Annual" if "annual" in original_name.lower() else ""
 
     # Construct the new filename
-    _, extension = os.path.splitext(original_path)
+    _, extension = os.path.splitext(original_name)
     new_file_name = f"{series_name} V{volume_year}{annual_str} #{issue_number_padded} ({date_formatted}){extension}"
     
     # Construct the new folder path, including the version string if available
@@ -693,21 +1023,21 @@ def organize_file(original_path, issue_details, output_dir, dry_run=False, versi
         comic_info_xml = generate_comic_info_xml(issue_details)
 
     if dry_run:
-        print(f"{Fore.CYAN} 🏃‍➡️ [DRY RUN] Would move and rename to: {new_file_path}{Style.RESET_ALL}")
+        log.info(" 🏃‍➡️ [DRY RUN] Would move and rename to: %s", new_file_path)
         if comic_info_xml:
             if skip_xml_write: # This case means we are enriching an existing file
-                 print(f"{Fore.CYAN} 🏃‍➡️ [DRY RUN] Would overwrite existing ComicInfo.xml with enriched data.{Style.RESET_ALL}")
+                 log.info(" 🏃‍➡️ [DRY RUN] Would overwrite existing ComicInfo.xml with enriched data.")
             else:
-                 print(f"{Fore.CYAN} 🏃‍➡️ [DRY RUN] Would generate and embed ComicInfo.xml.{Style.RESET_ALL}")
+                 log.info(" 🏃‍➡️ [DRY RUN] Would generate and embed ComicInfo.xml.")
 
     else:
-        print(f"{Fore.CYAN} 📦 Moving and renaming to: {new_file_path}{Style.RESET_ALL}")
-        os.makedirs(new_series_folder, exist_ok=True)
+        log.info(" 📦 Moving and renaming to: %s", new_file_path)
+        ensure_dir(new_series_folder)
         
         if original_path != new_file_path:
-            shutil.move(original_path, new_file_path)
+            move_file(original_path, new_file_path)
         else:
-            print(f"{Fore.YELLOW} ⚠️ Skipping move, file already organized.{Style.RESET_ALL}")
+            log.warning(" ⚠️ Skipping move, file already organized.")
 
         if comic_info_xml:
             if new_file_path.lower().endswith('.cbz'):
@@ -717,125 +1047,130 @@ def organize_file(original_path, issue_details, output_dir, dry_run=False, versi
                 else:
                     try:
                         with zipfile.ZipFile(new_file_path, 'a') as zf:
-                            if 'ComicInfo.xml' not in zf.namelist():
-                                zf.writestr('ComicInfo.xml', comic_info_xml)
-                                print(f"{Fore.GREEN} ✔ Successfully embedded ComicInfo.xml.{Style.RESET_ALL}")
+                            # Append mode writes only the new entry and the central directory,
+                            # leaving the existing pages where they are
+                            if not zip_has_member(zf, 'ComicInfo.xml'):
+                                zf.writestr('ComicInfo.xml', comic_info_xml, compress_type=zipfile.ZIP_DEFLATED)
+                                log.success(" ✔ Successfully embedded ComicInfo.xml.")
+                            elif zf.read('ComicInfo.xml') == comic_info_xml.encode('utf-8'):
+                                # e.g. re-running with --overwrite over unchanged metadata. Rewriting
+                                # would recompress every page to produce the same archive.
+                                log.success(" ✔ ComicInfo.xml is already up to date.")
                             else:
                                 # This case should ideally not be hit if logic is correct
-                                print(f"{Fore.YELLOW} ⚠️ ComicInfo.xml already exists. Overwriting...{Style.RESET_ALL}")
+                                log.warning(" ⚠️ ComicInfo.xml already exists. Overwriting...")
                                 overwrite_comic_info_in_archive(new_file_path, comic_info_xml)
                     except Exception as e:
-                        print(f"{Fore.RED} ✗ Error embedding ComicInfo.xml: {e}{Style.RESET_ALL}")
+                        log.error(" ✗ Error embedding ComicInfo.xml: %s", e)
 
             elif new_file_path.lower().endswith('.cbr'):
-                print(f"{Fore.YELLOW} ⚠️ Skipping ComicInfo.xml embedding for .cbr file.{Style.RESET_ALL}")
+                log.warning(" ⚠️ Skipping ComicInfo.xml embedding for .cbr file.")
     
     return new_file_path
 
+MULTISPACE_RE = re.compile(r' {2,}')
+
+# Slashes and colons become space-hyphen-space; other characters that are invalid in
+# file and directory names are removed
+SANITIZE_TABLE = str.maketrans({'/': ' - ', ':': ' - ', **dict.fromkeys('<>"\\|?*')})
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(name):
-    """Removes characters that are invalid for file and directory names."""
+    """
+    Removes characters that are invalid for file and directory names.
+    Memoized, since every issue of a series sanitizes the same series name.
+    """
     if not name:
         return ""
-    # Replace slashes with hyphens and colons with space-hyphen-space
-    name = name.replace('/', ' - ').replace(':', ' - ')
-    # Remove other invalid characters
-    invalid_chars = r'<>:"\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '')
+    name = name.translate(SANITIZE_TABLE)
     # Clean up any double spaces that might have been created
-    while '  ' in name:
-        name = name.replace('  ', ' ')
+    name = MULTISPACE_RE.sub(' ', name)
     return name.strip()
 
 
-def rmtree_with_retry(path, max_retries=5, delay_seconds=0.5):
-    """
-    Robustly removes a directory tree, retrying on PermissionError.
-    """
-    for i in range(max_retries):
-        try:
-            shutil.rmtree(path)
-            return
-        except PermissionError:
-            print(f"{Fore.YELLOW} ⚠️ Permission denied to remove {path}. Retrying in {delay_seconds}s... ({i+1}/{max_retries}){Style.RESET_ALL}")
-            time.sleep(delay_seconds)
-        except FileNotFoundError:
-            # Directory was already removed, which is fine.
-            return
-        except Exception as e:
-            print(f"{Fore.RED} ✗ Unexpected error while removing {path}: {e}{Style.RESET_ALL}")
-            break
-    print(f"{Fore.RED} ✗ Failed to remove directory {path} after {max_retries} retries.{Style.RESET_ALL}")
-
-
-def convert_cbr_to_cbz(cbr_path):
+def convert_cbr_to_cbz(cbr_path, show_progress=True):
     """
     Converts a .cbr file to a .cbz file, handling misnamed zip files.
+    show_progress is turned off when several conversions run at once, so their bars don't collide.
     """
     cbz_path = os.path.splitext(cbr_path)[0] + '.cbz'
     
     # Case 1: The file is a ZIP file misnamed as .cbr
     if zipfile.is_zipfile(cbr_path):
-        print(f"{Fore.CYAN} 🔄 File is a zip archive. Renaming {cbr_path} to .cbz...{Style.RESET_ALL}")
+        log.info(" 🔄 File is a zip archive. Renaming %s to .cbz...", cbr_path)
         try:
             os.rename(cbr_path, cbz_path)
-            print(f"{Fore.GREEN} ✔ Successfully renamed to {cbz_path}{Style.RESET_ALL}")
+            log.success(" ✔ Successfully renamed to %s", cbz_path)
             return cbz_path
         except OSError as e:
-            print(f"{Fore.RED} ✗ Error renaming file: {e}{Style.RESET_ALL}")
+            log.error(" ✗ Error renaming file: %s", e)
             return None
 
     # Case 2: The file is a genuine RAR file
-    if is_rarfile(cbr_path):
-        temp_dir = tempfile.mkdtemp()
+    if load_rarfile().is_rarfile(cbr_path):
         try:
-            with Progress(transient=True) as progress:
-                print(f"{Fore.CYAN} 🔄 Converting RAR {cbr_path} to .cbz...{Style.RESET_ALL}")
-                
-                with RarFile(cbr_path, 'r') as archive:
-                    infolist = archive.infolist()
-                    extract_task = progress.add_task("[cyan]Extracting files...", total=len(infolist))
-                    for member in infolist:
-                        archive.extract(member, path=temp_dir)
-                        progress.update(extract_task, advance=1)
-
-                files_to_zip = []
-                for root, _, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, temp_dir)
-                        files_to_zip.append((file_path, arcname))
-                
-                with zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                    zip_task = progress.add_task("[cyan]Creating .cbz...", total=len(files_to_zip))
-                    for file_path, arcname in files_to_zip:
-                        zf.write(file_path, arcname)
-                        progress.update(zip_task, advance=1)
+            with Progress(transient=True, disable=not show_progress) as progress:
+                log.info(" 🔄 Converting RAR %s to .cbz...", cbr_path)
+
+                # Stream each page straight from the RAR into the new zip, rather than
+                # extracting everything to a temp dir and reading it back from disk
+                with load_rarfile().RarFile(cbr_path, 'r') as archive, zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+                    members = [member for member in archive.infolist() if not member.is_dir()]
+                    convert_task = progress.add_task("[cyan]Creating .cbz...", total=len(members))
+                    for member in members:
+                        zinfo = zipfile.ZipInfo(member.filename.lstrip('/'), date_time=member.date_time or (1980, 1, 1, 0, 0, 0))
+                        # Store page images as they are; only text and other entries are deflated
+                        zinfo.compress_type = zipfile.ZIP_STORED if zinfo.filename.lower().endswith(PRECOMPRESSED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+                        with archive.open(member) as src, zf.open(zinfo, 'w', force_zip64=True) as dst:
+                            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                        progress.update(convert_task, advance=1)
             
+            # CRCs are computed while writing, so re-inflating every entry with testzip()
+            # is redundant. Just confirm the central directory lists everything we wrote.
             with zipfile.ZipFile(cbz_path, 'r') as zf:
-                if zf.testzip() is not None:
+                if len(zf.infolist()) != len(members):
                     raise Exception("Failed to validate the new .cbz file.")
             
-            print(f"{Fore.GREEN} ✔ Successfully converted to {cbz_path}{Style.RESET_ALL}")
+            log.success(" ✔ Successfully converted to %s", cbz_path)
             os.remove(cbr_path)
             return cbz_path
 
         except Exception as e:
-            print(f"{Fore.RED} ✗ Error converting {cbr_path}: {e}{Style.RESET_ALL}")
+            log.error(" ✗ Error converting %s: %s", cbr_path, e)
             if 'read enough data' in str(e):
-                print(f"{Fore.YELLOW} 💡 This error suggests the file may be corrupted or in an unsupported RAR format. Try extracting it manually.{Style.RESET_ALL}")
+                log.warning(" 💡 This error suggests the file may be corrupted or in an unsupported RAR format. Try extracting it manually.")
             if os.path.exists(cbz_path):
                 os.remove(cbz_path)
             return None
-        finally:
-            rmtree_with_retry(temp_dir)
     
     # Case 3: The file is not a recognized archive type
-    print(f"{Fore.RED} ✗ Skipped: {cbr_path} is not a valid RAR or ZIP file.{Style.RESET_ALL}")
+    log.error(" ✗ Skipped: %s is not a valid RAR or ZIP file.", cbr_path)
     return None
 
 
 
+def convert_cbr_files(cbr_paths):
+    """
+    Converts several .cbr files to .cbz, one archive per worker process, since each
+    conversion is independent and spends its time decompressing and recompressing.
+    Separate processes also mean no RarFile state is ever shared between conversions.
+    The workers' log messages are printed by this process.
+    Returns the new .cbz path (or None on failure) for each input, in order.
+    """
+    if len(cbr_paths) <= 1:
+        return [convert_cbr_to_cbz(cbr_path) for cbr_path in cbr_paths]
+
+    workers = min(os.cpu_count() or 1, len(cbr_paths))
+    with worker_logging() as (initializer, initargs), ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(partial(convert_cbr_to_cbz, show_progress=False), cbr_paths))
+
+def positive_int(value):
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive number, not {value}")
+    return number
+
 def main():
     # Parse command line arguments first
     parser = argparse.ArgumentParser(description='Organize comic book files.')
@@ -843,12 +1178,17 @@ def main():
     parser.add_argument('output_dir', nargs='?', default=None, help='(Optional) The directory to store the organized files. If not provided, organizes in-place.')
     parser.add_argument('--series-folder', help='(Optional) The name of a specific series folder to process within the input directory.')
     parser.add_argument('--dry-run', action='store_true', help='Perform a dry run without moving files.')
-    parser.add_argument('--force-refresh', action='store_true', help='Force a refresh of cached data for a specific series folder.')
+    parser.add_argument('--force-refresh', action='store_true', help='Ignore cached Comic Vine responses and issue details and fetch them again.')
     parser.add_argument('-o', '--overwrite', action='store_true', help='Treat issues as if they have no metadata, forcing a re-download and overwrite.')
     parser.add_argument('-y', '--yes', action='store_true', help='Automatically answer yes to all prompts and skip confirmations.')
     parser.add_argument('--comicvine-api-key', help='Set or update your Comic Vine API key. This will be saved for future use.')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Show debug output, such as rate limit sleeps.')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only show warnings, errors and prompts.')
+    parser.add_argument('--phash', action='store_true', help='Compute and show a perceptual hash of each cover that is looked up on Comic Vine.')
+    parser.add_argument('--cache-max-entries', type=positive_int, default=DEFAULT_CACHE_MAX_ENTRIES, help=f'Maximum number of entries kept in each local cache: issue details, cover hashes and series selections. Least recently used entries are evicted first. Defaults to {DEFAULT_CACHE_MAX_ENTRIES}.')
     init(autoreset=True)
     args = parser.parse_args()
+    setup_logging(verbose=args.verbose, quiet=args.quiet)
 
     print(f"""
 {Fore.RED} ______     {Fore.YELLOW}__  __     {Fore.GREEN}__   __     {Fore.CYAN}______     {Fore.BLUE}______     {Fore.MAGENTA}______    
@@ -865,6 +1205,9 @@ def main():
     config_dir = Path.home() / '.runarr'
     config_file = config_dir / 'config.json'
     cache_file = config_dir / 'cache.json'
+    response_cache_file = config_dir / 'responses.sqlite'
+    cover_hash_file = config_dir / 'cover_hashes.json'
+    series_selection_file = config_dir / 'series_selections.json'
     
     # Create config directory if it doesn't exist
     config_dir.mkdir(exist_ok=True, mode=0o700)  # Create with secure permissions
@@ -876,17 +1219,47 @@ def main():
             with open(config_file, 'r') as f:
                 config = json.load(f)
         except json.JSONDecodeError:
-            print(f"{Fore.YELLOW} ⚠️ Warning: Config file is corrupted. Creating a new one.{Style.RESET_ALL}")
+            log.warning(" ⚠️ Warning: Config file is corrupted. Creating a new one.")
 
-    # Load issue details cache
-    issue_details_cache = {}
+    # Load issue details cache. Entries are saved in least- to most-recently used order,
+    # so loading them in file order restores the LRU order (and trims any excess).
+    issue_details_cache = LRUCache(args.cache_max_entries)
     if cache_file.exists():
         try:
-            with open(cache_file, 'r') as f:
-                issue_details_cache = json.load(f)
-            print(f"{Fore.CYAN} 🏃‍➡️ Loaded {len(issue_details_cache)} items from cache.{Style.RESET_ALL}")
+            with open(cache_file, 'rb') as f:
+                issue_details_cache.update(orjson.loads(f.read()))
+            log.info(" 🏃‍➡️ Loaded %s items from cache.", len(issue_details_cache))
         except json.JSONDecodeError:
-            print(f"{Fore.YELLOW} ⚠️ Warning: Cache file is corrupted. Starting with an empty cache.{Style.RESET_ALL}")
+            log.warning(" ⚠️ Warning: Cache file is corrupted. Starting with an empty cache.")
+
+    # Cover hashes from earlier --phash runs, keyed by archive size, mtime and path
+    cover_hash_cache = LRUCache(args.cache_max_entries)
+    if args.phash and cover_hash_file.exists():
+        try:
+            with open(cover_hash_file, 'rb') as f:
+                cover_hash_cache.update(orjson.loads(f.read()))
+        except json.JSONDecodeError:
+            log.warning(" ⚠️ Warning: Cover hash file is corrupted. Starting with no saved hashes.")
+
+    # The series picked for each input folder on earlier runs, keyed by absolute path, so
+    # re-running over a folder with new issues doesn't prompt for its series again.
+    # Always loaded, since it is written back at the end of the run.
+    series_selections = LRUCache(args.cache_max_entries)
+    if series_selection_file.exists():
+        try:
+            with open(series_selection_file, 'rb') as f:
+                series_selections.update(orjson.loads(f.read()))
+        except json.JSONDecodeError:
+            log.warning(" ⚠️ Warning: Series selection file is corrupted. Starting with no saved selections.")
+
+    # Open the Comic Vine response cache, so already-seen searches, volumes and issues
+    # don't cost API calls on later runs
+    global RESPONSE_CACHE, FORCE_REFRESH
+    FORCE_REFRESH = args.force_refresh
+    try:
+        RESPONSE_CACHE = ResponseCache(response_cache_file)
+    except sqlite3.Error as e:
+        log.warning(" ⚠️ Warning: Could not open the response cache (%s). Continuing without it.", e)
     
     # Get API key from command line, environment, or config
     global COMICVINE_API_KEY
@@ -895,7 +1268,7 @@ def main():
         config['comicvine_api_key'] = args.comicvine_api_key
         with open(config_file, 'w') as f:
             json.dump(config, f)
-        print(f"{Fore.GREEN} ✔ Comic Vine API key has been saved.{Style.RESET_ALL}")
+        log.success(" ✔ Comic Vine API key has been saved.")
         COMICVINE_API_KEY = args.comicvine_api_key
     else:
         # Try to get the API key from config or environment
@@ -914,7 +1287,7 @@ Get an API key from: {Fore.BLUE}https://comicvine.gamespot.com/api/{Style.RESET_
     # Determine input_dir
     input_dir = args.input_dir if args.input_dir else os.getcwd()
     if args.input_dir is None:
-        print(f"{Style.DIM}No input directory specified. Using current directory: {input_dir}{Style.RESET_ALL}")
+        log.info("No input directory specified. Using current directory: %s", input_dir)
 
     # API key is now loaded at the beginning of main()
 
@@ -923,38 +1296,49 @@ Get an API key from: {Fore.BLUE}https://comicvine.gamespot.com/api/{Style.RESET_
 
     # Handle the --series-folder argument
     if args.series_folder:
-        target_folder = os.path.join(input_dir, args.series_folder)
+        target_folder = os.path.normpath(os.path.join(input_dir, args.series_folder))
         if not os.path.isdir(target_folder):
-            print(f"{Fore.RED} ✗ Error: The specified series folder does not exist: {target_folder}{Style.RESET_ALL}")
+            log.error(" ✗ Error: The specified series folder does not exist: %s", target_folder)
             return
-        comics_by_folder = {target_folder: [os.path.join(target_folder, f) for f in os.listdir(target_folder) if f.lower().endswith(('.cbz', '.cbr'))]}
+        comics, other_files, _ = scan_folder(target_folder)
+        comics_by_folder = {target_folder: (comics, other_files)}
     else:
         # Group all comics by their parent directory
-        all_comic_files = scan_comic_files(input_dir)
-        comics_by_folder = {}
-        for comic_file in all_comic_files:
-            folder = os.path.dirname(comic_file)
-            if folder not in comics_by_folder:
-                comics_by_folder[folder] = []
-            comics_by_folder[folder].append(comic_file)
+        comics_by_folder = scan_comic_files(input_dir)
 
+    # Seeded with the saved selections, unless --overwrite or --force-refresh asks for a
+    # fresh choice. A folder's own series.json still takes precedence, so those folders are
+    # left to resolve_volume. The issue lists aren't saved, as the response cache already
+    # keeps them for a day and new issues should show up after that.
     series_cache = {}
+    if not (args.overwrite or args.force_refresh):
+        for folder in comics_by_folder:
+            if os.path.exists(os.path.join(folder, 'series.json')):
+                continue
+            saved_volume = series_selections.get(os.path.abspath(folder))
+            if saved_volume:
+                series_cache[folder] = saved_volume
     volume_issues_cache = {}
 
+    # Worker threads for reading archives and for identifying comics, shared by every folder
+    # rather than started and torn down once per folder
+    prepare_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    comic_executor = ThreadPoolExecutor(max_workers=COMIC_WORKERS)
+
     try:
-        for folder, comics in comics_by_folder.items():
+        for folder, (comics, other_files) in comics_by_folder.items():
             print(f"\n{Style.BRIGHT}{Fore.MAGENTA} 🗂️ Processing folder: {folder}{Style.RESET_ALL}")
 
             # Extract version from folder name (e.g., "v1", "v2")
             folder_name = os.path.basename(folder)
-            version_match = re.search(r'\b(v\d+)\b', folder_name, re.IGNORECASE)
+            version_match = VERSION_RE.search(folder_name)
             version_str = version_match.group(1) if version_match else None
 
             # Confirm with the user before processing
             if not args.yes:
                 confirm = input(f"{Fore.YELLOW} 👉 Do you want to process this folder? (y/n): {Style.RESET_ALL}").lower().strip()
                 if confirm not in ['y', 'yes']:
-                    print(f"{Fore.CYAN} 🏃‍➡️ Skipping folder: {folder}{Style.RESET_ALL}")
+                    log.info(" 🏃‍➡️ Skipping folder: %s", folder)
                     continue
             
             new_series_folder_path = None
@@ -963,81 +1347,173 @@ Get an API key from: {Fore.BLUE}https://comicvine.gamespot.com/api/{Style.RESET_
             # Convert .cbr to .cbz in the current folder before processing
             if not args.dry_run:
                 cbr_files = [f for f in comics if f.lower().endswith('.cbr')]
-                for cbr_file in cbr_files:
-                    convert_cbr_to_cbz(cbr_file)
-                # Refresh the file list after conversion
-                comics = [f.replace('.cbr', '.cbz') if f.lower().endswith('.cbr') else f for f in comics]
+                converted = dict(zip(cbr_files, convert_cbr_files(cbr_files)))
+                comics = [converted.get(f) or f for f in comics]
+
+            # The folder was already listed by the scan, so split that listing into comics
+            # and extra files instead of reading the directory again
+            comic_files_in_folder = [f for f in comics if f.lower().endswith('.cbz')]  # Only look for .cbz files now
+            extra_files = [(path, name) for path, name in other_files if name.lower() not in ('series.json', 'cover.jpg', 'cvinfo')]
+
+            # The cover hash is only informational, so it is opt-in. Hashes are remembered per
+            # archive version, so unchanged comics aren't decompressed or hashed again.
+            cover_hashes = {}
+            hash_keys = {}
+            if args.phash:
+                hash_keys = {comic_file: cover_hash_key(comic_file) for comic_file in comic_files_in_folder}
+                cover_hashes = {comic_file: cover_hash_cache[key] for comic_file, key in hash_keys.items() if key in cover_hash_cache}
+
+            def prepare(comic_file):
+                return prepare_comic(comic_file, overwrite=args.overwrite, read_cover=args.phash and comic_file not in cover_hashes)
+
+            # Archive reads and cover extraction are I/O and decompression bound, so do them
+            # for the whole folder in parallel before the API loop below.
+            prepared_comics = dict(zip(comic_files_in_folder, prepare_executor.map(prepare, comic_files_in_folder)))
+
+            if args.phash:
+                # Covers without a saved hash are decoded and hashed in worker processes,
+                # each running one vectorized batch
+                covers = {comic_file: cover_data for comic_file, (_, _, cover_data) in prepared_comics.items() if cover_data and comic_file not in cover_hashes}
+                for comic_file, cover_hash in zip(covers, parallel_phash(list(covers.values()))):
+                    if cover_hash is None:
+                        log.warning(" ⚠️ Could not decode the cover of %s, so it has no cover hash.", os.path.basename(comic_file))
+                        continue
+                    cover_hashes[comic_file] = str(cover_hash)
+                    if hash_keys[comic_file]:
+                        cover_hash_cache[hash_keys[comic_file]] = cover_hashes[comic_file]
+                # Only the hashes are needed from here on, so stop holding every cover in memory
+                for comic_file in covers:
+                    local_details, is_complete, _ = prepared_comics[comic_file]
+                    prepared_comics[comic_file] = (local_details, is_complete, True)
+                del covers
+
+            def process_comic(comic_file):
+                """Identifies and organizes one comic. Runs on a worker thread; returns the new path or None."""
+                comic_name = os.path.basename(comic_file)
+                progress.update(task, description=f"Processing {comic_name}")
+
+                issue_details = None
+                skip_xml_write = False
+
+                # --- NEW: Prioritize and Assess local ComicInfo.xml ---
+                local_details, is_complete, cover_data = prepared_comics[comic_file]
+
+                if local_details:
+                    if is_complete:
+                        # If XML is complete, use it and skip API calls and XML writing
+                        log.success("  ✔ Using complete local ComicInfo.xml. Skipping API call.")
+                        issue_details = local_details
+                        skip_xml_write = True
+                    else:
+                        # If XML is incomplete, use its data to enrich from the API
+                        log.warning("  ⚠️ Incomplete ComicInfo.xml found. Attempting to enrich from API...")
+                        # We can reuse the identify_comic function, it will use the series/issue info
+                        # and fetch the full details in one go. The archive has already been read
+                        # successfully, so there is no need to decode its cover here.
+                        issue_details = identify_comic(comic_file, folder, None, series_cache, volume_issues_cache, issue_details_cache, overwrite=args.overwrite)
+                        # We will NOT skip XML write, as we want to overwrite the incomplete one.
+
+                # --- FALLBACK: Use existing API logic if no local XML was found ---
+                if not issue_details:
+                    cover_hash = cover_hashes.get(comic_file)
+                    if cover_data is None:
+                        if args.phash:
+                            cover_data = extract_cover_bytes(comic_file)
+                            cover_hash = phash_bytes([cover_data])[0] if cover_data else None
+                            if cover_hash is not None:
+                                cover_hash = str(cover_hash)
+                                hash_key = cover_hash_key(comic_file)
+                                if hash_key:
+                                    cover_hash_cache[hash_key] = cover_hash
+                        else:
+                            cover_data = has_cover_image(comic_file)
+                    if cover_data:
+                        issue_details = identify_comic(comic_file, folder, cover_hash, series_cache, volume_issues_cache, issue_details_cache, overwrite=args.overwrite)
+                    else:
+                        log.error("   ✗ Could not extract cover image from %s.", comic_name)
 
-            # Identify comic files and extra files
-            all_files_in_folder = [os.path.join(folder, f) for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
-            comic_files_in_folder = [f for f in all_files_in_folder if f.lower().endswith('.cbz')]  # Only look for .cbz files now
-            extra_files = [f for f in all_files_in_folder if f not in comic_files_in_folder and not f.lower().endswith('.cbr') and os.path.basename(f).lower() not in ['series.json', 'cover.jpg', 'cvinfo']]
+                # --- Organize the file with the determined details ---
+                new_file_path = None
+                if issue_details:
+                    new_file_path = organize_file(comic_file, issue_details, base_output_dir, args.dry_run, version_str, skip_xml_write=skip_xml_write)
 
-            with Progress(transient=True) as progress:
-                task = progress.add_task(f"[cyan]Processing {os.path.basename(folder)}...", total=len(comic_files_in_folder))
+                progress.update(task, advance=1)
+                return new_file_path
 
+            with Progress(transient=True) as progress:
+                task = progress.add_task(f"[cyan]Processing {folder_name}...", total=len(comic_files_in_folder))
+
+                # Selecting the series may prompt the user, so resolve it once here on the main thread.
+                # After that the workers only read the series and issue caches.
+                needs_api = any(not (local_details and is_complete) for local_details, is_complete, _ in prepared_comics.values())
+                series_title, series_year = parse_series_folder(folder_name)
+                if needs_api and series_title:
+                    resolve_volume(folder, series_title, series_year, series_cache, volume_issues_cache, base_output_dir, args.dry_run, progress, version_str, overwrite=args.overwrite)
+
+                # Each comic is mostly waiting on Comic Vine or the disk, so identify and organize them
+                # concurrently. A failure is reported for that comic alone instead of stopping the folder.
+                # Folders themselves stay sequential, since confirming a folder or picking its series prompts the user.
+                new_file_paths = {}
+                futures = {comic_executor.submit(process_comic, comic_file): comic_file for comic_file in comic_files_in_folder}
+                try:
+                    for future in as_completed(futures):
+                        comic_file = futures[future]
+                        try:
+                            new_file_paths[comic_file] = future.result()
+                        except Exception as e:
+                            log.error("   ✗ Error processing %s: %s", os.path.basename(comic_file), e)
+                            progress.update(task, advance=1)
+                except KeyboardInterrupt:
+                    # Drop the comics still queued, so only the ones already running finish
+                    # before the executor shuts down
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+                # The first organized comic, in folder order, decides the series folder
                 for comic_file in comic_files_in_folder:
-                    progress.update(task, description=f"Processing {os.path.basename(comic_file)}")
-                    
-                    issue_details = None
-                    skip_xml_write = False
-                    
-                    # --- NEW: Prioritize and Assess local ComicInfo.xml ---
-                    local_details, is_complete = read_comic_info_from_archive(comic_file, overwrite=args.overwrite)
-                    
-                    if local_details:
-                        if is_complete:
-                            # If XML is complete, use it and skip API calls and XML writing
-                            print(f"  {Fore.GREEN}✔ Using complete local ComicInfo.xml. Skipping API call.{Style.RESET_ALL}")
-                            issue_details = local_details
-                            skip_xml_write = True
-                        else:
-                            # If XML is incomplete, use its data to enrich from the API
-                            print(f"  {Fore.YELLOW}⚠️ Incomplete ComicInfo.xml found. Attempting to enrich from API...{Style.RESET_ALL}")
-                            # We can reuse the identify_comic function, it will use the series/issue info
-                            # and fetch the full details in one go.
-                            cover_image = extract_cover_image(comic_file)
-                            if cover_image:
-                                 issue_details = identify_comic(comic_file, cover_image, series_cache, volume_issues_cache, issue_details_cache, base_output_dir, args.dry_run, progress, version_str, overwrite=args.overwrite)
-                            # We will NOT skip XML write, as we want to overwrite the incomplete one.
-                    
-                    # --- FALLBACK: Use existing API logic if no local XML was found ---
-                    if not issue_details:
-                        cover_image = extract_cover_image(comic_file)
-                        if cover_image:
-                            issue_details = identify_comic(comic_file, cover_image, series_cache, volume_issues_cache, issue_details_cache, base_output_dir, args.dry_run, progress, version_str, overwrite=args.overwrite)
-                        else:
-                            print(f"  {Fore.RED} ✗ Could not extract cover image from {os.path.basename(comic_file)}.{Style.RESET_ALL}")
-
-                    # --- Organize the file with the determined details ---
-                    if issue_details:
-                        new_file_path = organize_file(comic_file, issue_details, base_output_dir, args.dry_run, version_str, skip_xml_write=skip_xml_write)
-                        if new_file_path:
-                            processed_comics.add(new_file_path)
-                            if not new_series_folder_path:
-                                new_series_folder_path = os.path.dirname(new_file_path)
-                    
-                    progress.update(task, advance=1)
+                    new_file_path = new_file_paths.get(comic_file)
+                    if new_file_path:
+                        processed_comics.add(new_file_path)
+                        if not new_series_folder_path:
+                            new_series_folder_path = os.path.dirname(new_file_path)
 
             # --- Extras and Cleanup Logic ---
             if not args.dry_run and new_series_folder_path:
                 # Move any remaining files to an "Extras" folder
                 if extra_files:
                     extras_folder = os.path.join(new_series_folder_path, 'Extras')
-                    print(f"  {Fore.CYAN} 📦 Moving {len(extra_files)} extra file(s) to: {extras_folder}{Style.RESET_ALL}")
+                    log.info("   📦 Moving %s extra file(s) to: %s", len(extra_files), extras_folder)
                     os.makedirs(extras_folder, exist_ok=True)
-                    for file_path in extra_files:
-                        shutil.move(file_path, os.path.join(extras_folder, os.path.basename(file_path)))
+                    for file_path, file_name in extra_files:
+                        move_file(file_path, os.path.join(extras_folder, file_name))
 
                 # Remove the original folder if it's empty and not the same as the new one
                 if not os.listdir(folder) and folder != new_series_folder_path:
-                    print(f"  {Fore.CYAN} 🗑️ Removing empty original folder: {folder}{Style.RESET_ALL}")
+                    log.info("   🗑️ Removing empty original folder: %s", folder)
                     os.rmdir(folder)
+                    ENSURED_DIRS.discard(folder)
     finally:
-        # Save the updated cache to the file
-        with open(cache_file, 'w') as f:
-            json.dump(issue_details_cache, f, indent=2)
-        print(f"\n{Fore.GREEN} ✔ Cache saved with {len(issue_details_cache)} items.{Style.RESET_ALL}")
+        prepare_executor.shutdown()
+        comic_executor.shutdown()
+
+        # Save the updated cache to the file. orjson writes a dict subclass in insertion
+        # order rather than LRU order, so copy it through items() first.
+        with open(cache_file, 'wb') as f:
+            f.write(orjson.dumps(dict(issue_details_cache.items()), option=orjson.OPT_INDENT_2))
+        log.success("\n ✔ Cache saved with %s items.", len(issue_details_cache))
+        if args.phash:
+            with open(cover_hash_file, 'wb') as f:
+                f.write(orjson.dumps(dict(cover_hash_cache.items())))
+        # Choices made during a dry run are only a preview, so the next real run asks again
+        if not args.dry_run:
+            for folder, volume in series_cache.items():
+                if volume:
+                    series_selections[os.path.abspath(folder)] = volume
+            with open(series_selection_file, 'wb') as f:
+                f.write(orjson.dumps(dict(series_selections.items())))
+        if RESPONSE_CACHE:
+            RESPONSE_CACHE.close()
 
 
 if __name__ == '__main__':
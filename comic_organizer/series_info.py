@@ -3,7 +3,10 @@ import os
 import re
 import requests
 from datetime import datetime
-from colorama import Fore, Style
+from comic_organizer.log import log
+
+# An HTML tag, stripped from Comic Vine descriptions to get plain text
+HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 def generate_series_data(series_details):
     """Generates the metadata dictionary for a series.json file."""
@@ -40,7 +43,7 @@ def generate_series_data(series_details):
 
     # Clean up description
     description_html = series_details.get('description', '') or ''
-    description_text = re.sub(r'<[^>]+>', '', description_html).strip()
+    description_text = HTML_TAG_RE.sub('', description_html).strip()
 
     # Construct the metadata dictionary
     metadata = {
@@ -70,8 +73,11 @@ def generate_series_data(series_details):
     }
     return metadata
 
-def write_series_json(series_data, series_folder, dry_run):
-    """Writes the series metadata to a series.json file and downloads the cover image."""
+def write_series_json(series_data, series_folder, dry_run, session=requests):
+    """
+    Writes the series metadata to a series.json file and downloads the cover image.
+    Pass a requests.Session as `session` to reuse its pooled connections for the download.
+    """
     if not series_data:
         return
 
@@ -81,13 +87,13 @@ def write_series_json(series_data, series_folder, dry_run):
             series_json_path = os.path.join(series_folder, 'series.json')
             with open(series_json_path, 'w', encoding='utf-8') as f:
                 json.dump(series_data, f, indent=4, ensure_ascii=False)
-            print(f"{Fore.GREEN}✔ Successfully wrote series.json to: {series_folder}{Style.RESET_ALL}")
+            log.success("✔ Successfully wrote series.json to: %s", series_folder)
 
             # Download cover image
             image_url = series_data.get('metadata', {}).get('comic_image')
             if image_url:
                 try:
-                    response = requests.get(image_url, stream=True)
+                    response = session.get(image_url, stream=True)
                     response.raise_for_status()
                     # Get the file extension from the URL
                     file_extension = os.path.splitext(image_url)[1]
@@ -96,16 +102,16 @@ def write_series_json(series_data, series_folder, dry_run):
                     with open(cover_path, 'wb') as f:
                         for chunk in response.iter_content(chunk_size=8192):
                             f.write(chunk)
-                    print(f"{Fore.GREEN}✔ Successfully downloaded cover image to: {cover_path}{Style.RESET_ALL}")
+                    log.success("✔ Successfully downloaded cover image to: %s", cover_path)
                 except requests.exceptions.RequestException as e:
-                    print(f"{Fore.RED} ✗ Error downloading cover image: {e}{Style.RESET_ALL}")
+                    log.error(" ✗ Error downloading cover image: %s", e)
         except IOError as e:
-            print(f"{Fore.RED} ✗ Error writing series.json: {e}{Style.RESET_ALL}")
+            log.error(" ✗ Error writing series.json: %s", e)
     else:
-        print(f"{Fore.CYAN} 🏃‍➡️ [DRY RUN] Would write series.json to: {os.path.join(series_folder, 'series.json')}{Style.RESET_ALL}")
+        log.info(" 🏃‍➡️ [DRY RUN] Would write series.json to: %s", os.path.join(series_folder, 'series.json'))
         image_url = series_data.get('metadata', {}).get('comic_image')
         if image_url:
             file_extension = os.path.splitext(image_url)[1]
             cover_filename = f"cover{file_extension}"
             cover_path = os.path.join(series_folder, cover_filename)
-            print(f"{Fore.CYAN} 🏃‍➡️ [DRY RUN] Would download cover image to: {cover_path}{Style.RESET_ALL}")
+            log.info(" 🏃‍➡️ [DRY RUN] Would download cover image to: %s", cover_path)